@@ -16,6 +16,8 @@ LOGS_DIR = BASE_DIR / "logs"
 # Model settings
 WHISPER_MODEL = "large-v3"  # Options: tiny, base, small, medium, large, large-v2, large-v3
 DIARIZATION_MODEL = "pyannote/speaker-diarization-3.1"
+WHISPER_CACHE_DIR = str(MODELS_DIR)  # Persistent download location for Whisper weights
+DIARIZATION_CACHE_DIR = str(MODELS_DIR / "pyannote")  # Persistent download location for pyannote models
 
 # Hugging Face token (replace with your actual token)
 HUGGING_FACE_TOKEN = "<ENTER_YOUR_TOKEN_HERE>"
@@ -36,7 +38,13 @@ OUTPUT_FORMATS = {
 # Processing settings
 LANGUAGE = "en"  # Language code for Whisper
 DEVICE = "auto"  # "auto", "cpu", or "cuda" for GPU
-BATCH_SIZE = 16  # For faster processing on powerful machines
+BATCH_SIZE = 16  # Whisper chunks decoded together on GPU (CPU always uses 1)
+VAD_MIN_SILENCE_MS = 160  # Split speech at pauses at least this long; lower values cut more silence (160 = batched faster-whisper default)
+# Parallel files in process_folder on CPU. Values > 1 start that many worker
+# processes, each loading its own Whisper + pyannote models (several GB of
+# RAM per worker for large-v3), so only raise this on machines with memory to spare
+MAX_WORKERS = 1
+CPU_THREADS = 0  # Whisper CPU threads, 0 = library default (process_folder workers set their own share)
 
 # Logging settings
 LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING, ERROR
@@ -0,0 +1,35 @@
+#!/bin/bash
+
+# Pre-download model weights for the meeting transcription system
+# Run this once (or during a container/image build) so the first
+# transcription doesn't pay for multi-GB downloads.
+# Requires HUGGING_FACE_TOKEN to be set in config.py
+
+set -euo pipefail
+
+echo "📥 Downloading transcription models..."
+echo "================================================"
+
+python3 - << 'PYEOF'
+import config
+
+from faster_whisper import download_model
+from huggingface_hub import snapshot_download
+
+print(f"🎙️  Whisper: {config.WHISPER_MODEL}")
+download_model(config.WHISPER_MODEL, cache_dir=config.WHISPER_CACHE_DIR)
+
+# The diarization pipeline pulls its segmentation and embedding models
+# separately; all three are read from DIARIZATION_CACHE_DIR at load time
+for repo_id in (
+    config.DIARIZATION_MODEL,
+    "pyannote/segmentation-3.0",
+    "pyannote/wespeaker-voxceleb-resnet34-LM",
+):
+    print(f"🗣️  Diarization: {repo_id}")
+    snapshot_download(repo_id, token=config.HUGGING_FACE_TOKEN,
+                      cache_dir=config.DIARIZATION_CACHE_DIR)
+PYEOF
+
+echo ""
+echo "✅ Models downloaded!"
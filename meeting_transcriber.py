@@ -10,41 +10,105 @@ Author: Harshit Mishra
 Created: 2025-August
 """
 
-import whisper
+import os
+from pathlib import Path
+
+# pyannote reads PYANNOTE_CACHE once at import time, and the diarization
+# pipeline loads its segmentation/embedding models from there, so point it
+# at the persistent models directory before pyannote is imported
+try:
+    from config import DIARIZATION_CACHE_DIR as _DIARIZATION_CACHE_DIR
+    os.environ.setdefault('PYANNOTE_CACHE', str(_DIARIZATION_CACHE_DIR))
+except ImportError:
+    pass
+
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+from huggingface_hub.utils import LocalEntryNotFoundError
 import torch
+import numpy as np
 from pyannote.audio import Pipeline
 from pyannote.core import Segment
 import librosa
 import soundfile as sf
-import os
-import json
-from datetime import timedelta
-import pandas as pd
+import gc
+import orjson
+import csv
+import hashlib
+import threading
+import subprocess
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_EXCEPTION
+from bisect import bisect_left
 import logging
-from pathlib import Path
+
+# faster-whisper and pyannote both work on 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# Write buffer for output files; long meetings produce multi-MB outputs
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Column order of the analysis CSV
+CSV_FIELDNAMES = ["start", "end", "duration", "speaker", "text", "confidence",
+                  "start_formatted", "end_formatted"]
+
+# Process-wide model cache shared by all MeetingTranscriber instances.
+# Keys are ('whisper', model_name, device, compute_type, cpu_threads) and
+# ('diarization', model_id, token_hash, device).
+_MODEL_CACHE = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_model(key, loader):
+    """Return the cached model for key, calling loader() on first use"""
+    # Held for the whole load so a background preload and the main thread
+    # never load the same model twice
+    with _MODEL_CACHE_LOCK:
+        if key not in _MODEL_CACHE:
+            _MODEL_CACHE[key] = loader()
+        return _MODEL_CACHE[key]
+
 
 class MeetingTranscriber:
-    def __init__(self, config_file=None):
+    def __init__(self, config_file=None, config=None):
         """
         Initialize the Meeting Transcriber
         
+        Only reads configuration and prepares directories; models are loaded
+        by ensure_models_loaded(), which transcribe_with_speakers() calls.
+        
         Args:
             config_file (str): Path to configuration file (optional)
+            config (dict): Already loaded configuration, used instead of config_file (optional)
         """
         # Setup logging
         self._setup_logging()
         
         # Load configuration
-        self.config = self._load_config(config_file)
+        self.config = dict(config) if config is not None else self._load_config(config_file)
+        self.device = self._resolve_device()
         
         # Setup output directories
         self._setup_directories()
         
-        # Load models
-        self._load_models()
+        # Models are loaded on demand
+        self.whisper_model = None
+        self.whisper_pipeline = None
+        self.diarization_pipeline = None
+        self.diarization_stream = None
+    
+    def ensure_models_loaded(self):
+        """Load Whisper and diarization models if this instance has none yet"""
+        if self.whisper_pipeline is None or self.diarization_pipeline is None:
+            self._load_models()
     
     def _setup_logging(self):
         """Setup logging configuration"""
+        self.logger = logging.getLogger(__name__)
+        
+        # Configure once per process; later instances reuse the handlers
+        if logging.getLogger().handlers:
+            return
+        
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
         
@@ -56,7 +120,6 @@ class MeetingTranscriber:
                 logging.StreamHandler()
             ]
         )
-        self.logger = logging.getLogger(__name__)
     
     def _load_config(self, config_file):
         """Load configuration settings"""
@@ -67,9 +130,17 @@ class MeetingTranscriber:
             # Map the config variables to our expected format
             loaded_config = {
                 'whisper_model': getattr(config, 'WHISPER_MODEL', 'large-v3'),
+                'whisper_cache_dir': str(getattr(config, 'WHISPER_CACHE_DIR', '/Users/harsmis/Downloads/transcription/models')),
+                'diarization_cache_dir': str(getattr(config, 'DIARIZATION_CACHE_DIR', '/Users/harsmis/Downloads/transcription/models/pyannote')),
+                'diarization_model': getattr(config, 'DIARIZATION_MODEL', 'pyannote/speaker-diarization-3.1'),
                 'hf_token': getattr(config, 'HUGGING_FACE_TOKEN', 'YOUR_HUGGING_FACE_TOKEN'),
                 'output_base_dir': str(getattr(config, 'OUTPUT_DIR', '/Users/harsmis/Downloads/transcription/output')),
-                'audio_dir': str(getattr(config, 'AUDIO_DIR', '/Users/harsmis/Downloads/transcription/audio_files'))
+                'audio_dir': str(getattr(config, 'AUDIO_DIR', '/Users/harsmis/Downloads/transcription/audio_files')),
+                'batch_size': getattr(config, 'BATCH_SIZE', 16),
+                'device': getattr(config, 'DEVICE', 'auto'),
+                'max_workers': getattr(config, 'MAX_WORKERS', 1),
+                'cpu_threads': getattr(config, 'CPU_THREADS', 0),
+                'vad_min_silence_ms': getattr(config, 'VAD_MIN_SILENCE_MS', 160)
             }
             
             self.logger.info("Successfully loaded config.py")
@@ -80,9 +151,17 @@ class MeetingTranscriber:
             # Fallback to default config
             default_config = {
                 'whisper_model': 'large-v3',
+                'whisper_cache_dir': '/Users/harsmis/Downloads/transcription/models',
+                'diarization_cache_dir': '/Users/harsmis/Downloads/transcription/models/pyannote',
+                'diarization_model': 'pyannote/speaker-diarization-3.1',
                 'hf_token': 'YOUR_HUGGING_FACE_TOKEN',
                 'output_base_dir': '/Users/harsmis/Downloads/transcription/output',
-                'audio_dir': '/Users/harsmis/Downloads/transcription/audio_files'
+                'audio_dir': '/Users/harsmis/Downloads/transcription/audio_files',
+                'batch_size': 16,
+                'device': 'auto',
+                'max_workers': 1,
+                'cpu_threads': 0,
+                'vad_min_silence_ms': 160
             }
             return default_config
     
@@ -100,9 +179,40 @@ class MeetingTranscriber:
             dir_path.mkdir(parents=True, exist_ok=True)
     
     def _load_models(self):
-        """Load Whisper and diarization models"""
+        """Load Whisper and diarization models (reused from the process-wide cache)"""
         self.logger.info("Loading Whisper model...")
-        self.whisper_model = whisper.load_model(self.config['whisper_model'])
+        model_name = self.config['whisper_model']
+        device = self.device
+        if device == "cuda":
+            # TF32 tensor cores for pyannote's float32 matmuls/convolutions
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+            # One stream per instance, so the caching allocator can reuse
+            # blocks from earlier files
+            if self.diarization_stream is None:
+                self.diarization_stream = torch.cuda.Stream()
+        # CTranslate2 runs FP16 kernels on GPU and INT8 quantized weights on CPU
+        compute_type = "float16" if device == "cuda" else "int8"
+        cache_dir = self.config['whisper_cache_dir']
+        cpu_threads = self.config['cpu_threads']
+        
+        def load_whisper():
+            try:
+                # Skip the Hub round-trip when the snapshot is already on disk
+                return WhisperModel(model_name, device=device, compute_type=compute_type,
+                                    cpu_threads=cpu_threads, download_root=cache_dir,
+                                    local_files_only=True)
+            except LocalEntryNotFoundError:
+                self.logger.info(f"Downloading Whisper model to {cache_dir}...")
+                return WhisperModel(model_name, device=device, compute_type=compute_type,
+                                    cpu_threads=cpu_threads, download_root=cache_dir)
+        
+        self.whisper_model = _get_cached_model(
+            ('whisper', model_name, device, compute_type, cpu_threads),
+            load_whisper
+        )
+        # Decodes VAD chunks of one file in batches of config['batch_size']
+        self.whisper_pipeline = BatchedInferencePipeline(model=self.whisper_model)
         
         self.logger.info("Loading speaker diarization model...")
         
@@ -121,9 +231,14 @@ class MeetingTranscriber:
         
         try:
             # Load diarization pipeline
-            self.diarization_pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1",
-                use_auth_token=token
+            model_id = self.config['diarization_model']
+            diarization_cache_dir = self.config['diarization_cache_dir']
+            token_hash = hashlib.sha256(token.encode('utf-8')).hexdigest()
+            self.diarization_pipeline = _get_cached_model(
+                ('diarization', model_id, token_hash, device),
+                lambda: Pipeline.from_pretrained(
+                    model_id, use_auth_token=token, cache_dir=diarization_cache_dir
+                ).to(torch.device(device))
             )
             self.logger.info("Models loaded successfully!")
             
@@ -139,97 +254,210 @@ class MeetingTranscriber:
                 f"3. Your token in config.py starts with 'hf_'"
             )
     
-    def _convert_audio_if_needed(self, audio_path):
-        """Convert audio to WAV format if needed"""
-        audio_path = Path(audio_path)
+    def _resolve_device(self):
+        """Map the configured device ("auto", "cpu" or "cuda") to a concrete one"""
+        device = self.config['device']
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        elif device == "cuda" and not torch.cuda.is_available():
+            self.logger.warning("CUDA requested but not available, falling back to CPU")
+            device = "cpu"
+        self.logger.info(f"Using device: {device}")
+        return device
+    
+    def unload(self):
+        """
+        Drop this instance's models and the shared cache, then free CPU/GPU memory
         
-        # If already WAV, return as-is
-        if audio_path.suffix.lower() == '.wav':
-            return str(audio_path)
+        Memory is only released once no other live instance still references
+        the same models. The next transcription reloads them on demand.
+        """
+        self.whisper_model = None
+        self.whisper_pipeline = None
+        self.diarization_pipeline = None
+        with _MODEL_CACHE_LOCK:
+            _MODEL_CACHE.clear()
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    
+    def _load_audio(self, audio_path):
+        """Decode audio to a 16 kHz mono float32 array for Whisper and pyannote"""
+        audio_path = Path(audio_path)
         
-        # Create temp WAV file
-        temp_wav = audio_path.parent / f"{audio_path.stem}_temp.wav"
+        # Uncompressed input already at 16 kHz can be read as-is
+        if audio_path.suffix.lower() in ('.wav', '.flac'):
+            try:
+                if sf.info(str(audio_path)).samplerate == SAMPLE_RATE:
+                    audio, _ = sf.read(str(audio_path), dtype='float32')
+                    return audio.mean(axis=1) if audio.ndim > 1 else audio
+            except (RuntimeError, sf.LibsndfileError) as e:
+                # e.g. a WAV codec libsndfile can't parse; ffmpeg usually can
+                self.logger.info(f"soundfile could not read {audio_path.name} ({e}), using ffmpeg")
         
         try:
-            self.logger.info(f"Converting {audio_path.suffix} to WAV format...")
+            self.logger.info(f"Decoding {audio_path.suffix} audio at {SAMPLE_RATE} Hz...")
+            return self._decode_with_ffmpeg(audio_path)
             
-            # Load audio and convert to WAV
-            audio_data, sample_rate = librosa.load(str(audio_path), sr=None)
-            sf.write(str(temp_wav), audio_data, sample_rate)
-            
-            self.logger.info(f"Converted to: {temp_wav}")
-            return str(temp_wav)
+        except FileNotFoundError:
+            if not audio_path.exists():
+                raise
+            self.logger.warning("ffmpeg not found on PATH, falling back to librosa (slower)")
+            audio, _ = librosa.load(str(audio_path), sr=SAMPLE_RATE, mono=True, dtype=np.float32)
+            return audio
             
         except Exception as e:
-            self.logger.error(f"Audio conversion failed: {str(e)}")
-            # Try to use original file anyway
-            return str(audio_path)
+            self.logger.error(f"Audio decoding failed: {str(e)}")
+            raise
+    
+    def _decode_with_ffmpeg(self, audio_path):
+        """Pipe audio through ffmpeg as raw 16-bit mono PCM at SAMPLE_RATE"""
+        cmd = [
+            "ffmpeg", "-nostdin", "-threads", "0",
+            "-i", str(audio_path),
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE),
+            "-"
+        ]
+        try:
+            raw = subprocess.run(cmd, capture_output=True, check=True).stdout
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"ffmpeg failed to decode {audio_path}: {e.stderr.decode(errors='replace')}") from e
+        
+        return np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
 
-    def transcribe_with_speakers(self, audio_path, output_name=None):
+    def transcribe_with_speakers(self, audio_path, output_name=None, audio=None):
         """
         Transcribe audio file with speaker diarization
         
         Args:
             audio_path (str): Path to audio file
             output_name (str): Custom output name (optional)
+            audio (np.ndarray): audio_path already decoded by _load_audio (optional)
         """
         self.logger.info(f"Processing: {audio_path}")
+        self.ensure_models_loaded()
+        
+        # Decode once in memory; both models consume the same array
+        if audio is None:
+            audio = self._load_audio(audio_path)
         
-        # Convert audio if needed
-        processed_audio_path = self._convert_audio_if_needed(audio_path)
-        temp_file_created = processed_audio_path != audio_path
+        # Generate output name
+        if output_name is None:
+            output_name = Path(audio_path).stem
         
+        # Steps 1+2: Speaker diarization and transcription are independent
+        # until alignment, so run them side by side
+        self.logger.info("Performing speaker diarization and transcribing audio...")
+        executor = ThreadPoolExecutor(max_workers=2)
         try:
-            # Generate output name
-            if output_name is None:
-                output_name = Path(audio_path).stem
-            
-            # Step 1: Speaker Diarization
-            self.logger.info("Performing speaker diarization...")
-            diarization = self.diarization_pipeline(processed_audio_path)
-            
-            # Step 2: Transcribe entire audio
-            self.logger.info("Transcribing audio...")
-            result = self.whisper_model.transcribe(
-                processed_audio_path,
-                language="en",
-                task="transcribe"
-            )
-            
-            # Step 3: Align transcription with speakers
-            self.logger.info("Aligning transcription with speakers...")
-            segments_with_speakers = self._align_transcription_with_speakers(
-                result["segments"], diarization
-            )
-            
-            # Step 4: Generate outputs
-            self._save_all_outputs(segments_with_speakers, output_name)
-            
-            self.logger.info(f"Transcription complete! Files saved with prefix '{output_name}'")
-            return segments_with_speakers
-            
+            diarization_future = executor.submit(self._run_diarization, audio)
+            transcription_future = executor.submit(self._run_transcription, audio)
+            # Surface a failure in either step right away instead of waiting
+            # for the other one to finish the whole file
+            done, _ = wait((diarization_future, transcription_future), return_when=FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+            diarization = diarization_future.result()
+            whisper_segments = transcription_future.result()
         finally:
-            # Clean up temporary file if created
-            if temp_file_created and os.path.exists(processed_audio_path):
-                try:
-                    os.remove(processed_audio_path)
-                    self.logger.info("Cleaned up temporary WAV file")
-                except Exception as e:
-                    self.logger.warning(f"Could not remove temp file: {e}")
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Step 3: Align transcription with speakers
+        self.logger.info("Aligning transcription with speakers...")
+        segments_with_speakers = self._align_transcription_with_speakers(
+            whisper_segments, diarization
+        )
+        
+        # Step 4: Generate outputs
+        self._save_all_outputs(segments_with_speakers, output_name)
+        
+        self.logger.info(f"Transcription complete! Files saved with prefix '{output_name}'")
+        return segments_with_speakers
+    
+    def _run_diarization(self, audio):
+        """Run the pyannote pipeline on an in-memory waveform"""
+        waveform = {
+            "waveform": torch.from_numpy(audio)[None],
+            "sample_rate": SAMPLE_RATE
+        }
+        if self.device != "cuda":
+            return self.diarization_pipeline(waveform)
+        
+        # Separate stream so diarization kernels don't serialize with other
+        # work queued on the default stream
+        with torch.cuda.stream(self.diarization_stream):
+            diarization = self.diarization_pipeline(waveform)
+        self.diarization_stream.synchronize()
+        return diarization
+    
+    def _run_transcription(self, audio):
+        """Run Whisper on an in-memory waveform and collect its segments"""
+        # Batching pays off on GPU; int8 CPU decoding gains little from it
+        # and every extra chunk multiplies memory by the beam size
+        batch_size = self.config['batch_size'] if self.device == "cuda" else 1
+        whisper_segments, info = self.whisper_pipeline.transcribe(
+            audio,
+            language="en",
+            task="transcribe",
+            # Silero VAD drops silent stretches before they reach the decoder
+            vad_filter=True,
+            vad_parameters={"min_silence_duration_ms": self.config['vad_min_silence_ms']},
+            beam_size=5,
+            batch_size=batch_size,
+            # The batched pipeline defaults to one segment per VAD chunk (up to
+            # 30 s); keep Whisper's timestamped segments so speakers are
+            # resolved at the same granularity as unbatched decoding
+            without_timestamps=False
+        )
+        # Segments are produced lazily; consume them here so decoding happens
+        # in this worker thread rather than during alignment
+        return list(whisper_segments)
     
     def _align_transcription_with_speakers(self, whisper_segments, diarization):
         """
         Align Whisper transcription segments with speaker diarization
+        
+        Args:
+            whisper_segments: Iterable of faster-whisper Segment tuples
+            diarization: pyannote Annotation with speaker turns
         """
+        # Flatten the diarization once, ordered by start time for the sweep
+        # below (pyannote already yields turns in that order)
+        tracks = sorted(
+            ((turn.start, turn.end, speaker) for turn, _, speaker in diarization.itertracks(yield_label=True)),
+            key=lambda track: track[0]
+        )
+        # Speakers get small integer ids in order of first appearance
+        speaker_ids = {}
+        for _, _, speaker in tracks:
+            speaker_ids.setdefault(speaker, len(speaker_ids))
+        speaker_labels = list(speaker_ids)
+        turn_bounds = [(turn_start, turn_end) for turn_start, turn_end, _ in tracks]
+        turn_speakers = [speaker_ids[speaker] for _, _, speaker in tracks]
+        starts = [turn_start for turn_start, _ in turn_bounds]
+        ends = [turn_end for _, turn_end in turn_bounds]
+        # Display names only depend on the raw pyannote label, so build them once
+        label_map = {label: f"Speaker_{label.split('_')[-1]}" for label in speaker_labels}
+        
         aligned_segments = []
+        lo = 0
         
         for segment in whisper_segments:
-            start_time = segment["start"]
-            end_time = segment["end"]
-            text = segment["text"].strip()
+            start_time = segment.start
+            end_time = segment.end
+            text = segment.text.strip()
+            
+            # Whisper segments are sorted too, so turns that ended before this
+            # segment can never overlap a later one; only [lo, hi) can overlap
+            while lo < len(ends) and ends[lo] <= start_time:
+                lo += 1
+            hi = bisect_left(starts, end_time)
             
             # Find the most overlapping speaker for this segment
-            speaker = self._find_dominant_speaker(start_time, end_time, diarization)
+            raw_speaker = self._find_dominant_speaker(
+                start_time, end_time, turn_bounds[lo:hi], turn_speakers[lo:hi], speaker_labels
+            )
+            speaker = label_map[raw_speaker] if raw_speaker is not None else "Unknown"
             
             aligned_segments.append({
                 "start": start_time,
@@ -237,35 +465,40 @@ class MeetingTranscriber:
                 "duration": end_time - start_time,
                 "speaker": speaker,
                 "text": text,
-                "confidence": segment.get("avg_logprob", 0)
+                "confidence": segment.avg_logprob
             })
         
         return aligned_segments
     
-    def _find_dominant_speaker(self, start_time, end_time, diarization):
+    def _find_dominant_speaker(self, start_time, end_time, turns, speaker_ids, speaker_labels):
         """
         Find the speaker who talks the most during a given time segment
+        
+        Returns the raw pyannote label, or None when no turn overlaps.
+        
+        Args:
+            turns: List of (start, end) times of candidate diarization turns
+            speaker_ids: Index into speaker_labels for each turn
+            speaker_labels: Unique raw pyannote speaker labels
         """
-        segment_duration = end_time - start_time
-        speaker_durations = {}
+        # Per-speaker overlap, indexed by speaker id
+        speaker_durations = [0.0] * len(speaker_labels)
+        # Speaker ids in the order their first overlapping turn appears
+        overlapping_speakers = []
         
-        for turn, _, speaker in diarization.itertracks(yield_label=True):
+        for (turn_start, turn_end), speaker_id in zip(turns, speaker_ids):
             # Calculate overlap between the transcription segment and speaker turn
-            overlap_start = max(start_time, turn.start)
-            overlap_end = min(end_time, turn.end)
-            
-            if overlap_start < overlap_end:
-                overlap_duration = overlap_end - overlap_start
-                if speaker not in speaker_durations:
-                    speaker_durations[speaker] = 0
-                speaker_durations[speaker] += overlap_duration
-        
-        if not speaker_durations:
-            return "Unknown"
-        
-        # Return speaker with most overlap
-        dominant_speaker = max(speaker_durations, key=speaker_durations.get)
-        return f"Speaker_{dominant_speaker.split('_')[-1]}"
+            overlap = min(end_time, turn_end) - max(start_time, turn_start)
+            if overlap > 0:
+                if not speaker_durations[speaker_id]:
+                    overlapping_speakers.append(speaker_id)
+                speaker_durations[speaker_id] += overlap
+        
+        if not overlapping_speakers:
+            return None
+        
+        # Return speaker with most overlap; ties go to the first one met
+        return speaker_labels[max(overlapping_speakers, key=speaker_durations.__getitem__)]
     
     def _save_all_outputs(self, segments, output_name):
         """Save all output formats"""
@@ -281,48 +514,133 @@ class MeetingTranscriber:
         csv_path = self.output_dirs['analysis'] / f"{output_name}_analysis.csv"
         self._save_csv_analysis(segments, csv_path)
     
+    @staticmethod
+    def _format_timestamp(seconds):
+        """Format seconds as H:MM:SS (same as str(timedelta) for whole seconds)"""
+        seconds = int(seconds)
+        return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+    
     def _save_detailed_json(self, segments, output_path):
         """Save detailed transcription with timestamps and speakers"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(segments, f, indent=2, ensure_ascii=False)
+        # orjson emits UTF-8 bytes directly and handles NumPy scalars natively
+        with open(output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(segments, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         self.logger.info(f"Saved detailed JSON: {output_path}")
     
     def _save_readable_transcript(self, segments, output_path):
         """Save human-readable transcript"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("MEETING TRANSCRIPT\n")
-            f.write("=" * 50 + "\n\n")
+        # Collected and written with a single call
+        parts = ["MEETING TRANSCRIPT\n", "=" * 50 + "\n\n"]
+        
+        current_speaker = None
+        for segment in segments:
+            speaker = segment["speaker"]
             
-            current_speaker = None
-            for segment in segments:
-                speaker = segment["speaker"]
-                text = segment["text"]
-                timestamp = str(timedelta(seconds=int(segment["start"])))
-                
-                if speaker != current_speaker:
-                    f.write(f"\n[{timestamp}] {speaker}:\n")
-                    current_speaker = speaker
-                
-                f.write(f"{text}\n")
+            if speaker != current_speaker:
+                parts.append(f"\n[{self._format_timestamp(segment['start'])}] {speaker}:\n")
+                current_speaker = speaker
+            
+            parts.append(f"{segment['text']}\n")
+        
+        with open(output_path, 'w', buffering=OUTPUT_BUFFER_SIZE, encoding='utf-8') as f:
+            f.write("".join(parts))
         self.logger.info(f"Saved transcript: {output_path}")
     
     def _save_csv_analysis(self, segments, output_path):
         """Save CSV for further analysis"""
-        df = pd.DataFrame(segments)
-        df['start_formatted'] = df['start'].apply(lambda x: str(timedelta(seconds=int(x))))
-        df['end_formatted'] = df['end'].apply(lambda x: str(timedelta(seconds=int(x))))
-        df.to_csv(output_path, index=False)
+        with open(output_path, 'w', buffering=OUTPUT_BUFFER_SIZE, encoding='utf-8', newline='') as f:
+            # pandas.to_csv ended rows with os.linesep; keep the same line endings
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES, lineterminator=os.linesep)
+            writer.writeheader()
+            for segment in segments:
+                writer.writerow({
+                    **segment,
+                    "start_formatted": self._format_timestamp(segment["start"]),
+                    "end_formatted": self._format_timestamp(segment["end"])
+                })
         self.logger.info(f"Saved analysis CSV: {output_path}")
     
-    def process_folder(self, folder_path, supported_formats=('.wav', '.mp3', '.m4a', '.flac')):
-        """Process all audio files in a folder"""
-        for filename in os.listdir(folder_path):
-            if filename.lower().endswith(supported_formats):
-                audio_path = os.path.join(folder_path, filename)
+    def process_folder(self, folder_path, supported_formats=('.wav', '.mp3', '.m4a', '.flac'), max_workers=None):
+        """
+        Process all audio files in a folder
+        
+        Args:
+            folder_path (str): Folder containing audio files
+            supported_formats (tuple): File extensions to pick up
+            max_workers (int): Parallel worker processes on CPU (defaults to config MAX_WORKERS)
+        """
+        audio_paths = [
+            os.path.join(folder_path, filename)
+            for filename in sorted(os.listdir(folder_path))
+            if filename.lower().endswith(supported_formats)
+        ]
+        if max_workers is None:
+            max_workers = self.config['max_workers']
+        
+        if self.device == "cuda" or max_workers <= 1 or len(audio_paths) <= 1:
+            # A single GPU (or a single worker) runs inference serially with
+            # this instance's models; only decoding of the next file overlaps
+            self._process_files_with_prefetch(audio_paths)
+            return
+        
+        # Workers load their own models; don't keep a third copy resident here
+        self.unload()
+        
+        # Split the cores between workers, so concurrent diarization and
+        # Whisper inside each worker don't oversubscribe the CPU
+        threads_per_worker = max(1, (os.cpu_count() or 1) // max_workers)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.config, threads_per_worker)
+        ) as executor:
+            futures = {
+                executor.submit(_transcribe_in_worker, audio_path): audio_path
+                for audio_path in audio_paths
+            }
+            for future in as_completed(futures):
                 try:
-                    self.transcribe_with_speakers(audio_path)
+                    future.result()
                 except Exception as e:
-                    print(f"Error processing {filename}: {str(e)}")
+                    print(f"Error processing {os.path.basename(futures[future])}: {str(e)}")
+    
+    def _process_files_with_prefetch(self, audio_paths):
+        """Transcribe files one at a time while a helper thread decodes the next one"""
+        with ThreadPoolExecutor(max_workers=1) as decoder:
+            next_audio = decoder.submit(self._load_audio, audio_paths[0]) if audio_paths else None
+            for index, audio_path in enumerate(audio_paths):
+                current_audio = next_audio
+                if index + 1 < len(audio_paths):
+                    next_audio = decoder.submit(self._load_audio, audio_paths[index + 1])
+                try:
+                    self.transcribe_with_speakers(audio_path, audio=current_audio.result())
+                except Exception as e:
+                    print(f"Error processing {os.path.basename(audio_path)}: {str(e)}")
+
+
+# Transcriber owned by a process_folder worker process, created on first use
+_WORKER_TRANSCRIBER = None
+# Parent transcriber's config with this worker's Whisper thread share, set by _init_worker
+_WORKER_CONFIG = None
+
+
+def _init_worker(config, num_threads):
+    """ProcessPoolExecutor initializer: adopt the parent's config and split the thread budget"""
+    global _WORKER_CONFIG
+    # Diarization (torch) and Whisper (CTranslate2) run at the same time
+    whisper_threads = max(1, num_threads // 2)
+    torch.set_num_threads(max(1, num_threads - whisper_threads))
+    _WORKER_CONFIG = {**config, 'cpu_threads': whisper_threads}
+
+
+def _transcribe_in_worker(audio_path):
+    """ProcessPoolExecutor entry point for process_folder"""
+    global _WORKER_TRANSCRIBER
+    if _WORKER_TRANSCRIBER is None:
+        _WORKER_TRANSCRIBER = MeetingTranscriber(config=_WORKER_CONFIG)
+    # Outputs are already on disk; don't pickle the segments back to the parent
+    _WORKER_TRANSCRIBER.transcribe_with_speakers(audio_path)
 
 # Usage Example
 def main():
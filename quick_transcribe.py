@@ -6,9 +6,17 @@ Usage: python quick_transcribe.py <audio_file_path>
 
 import sys
 import os
+import threading
 from pathlib import Path
 from meeting_transcriber import MeetingTranscriber
 
+def _preload_models(transcriber):
+    """Load models in the background; main() retries and reports on failure"""
+    try:
+        transcriber.ensure_models_loaded()
+    except Exception as e:
+        transcriber.logger.warning(f"Background model preload failed, retrying on first use: {e}")
+
 def main():
     if len(sys.argv) != 2:
         print("Usage: python quick_transcribe.py <audio_file_path>")
@@ -16,6 +24,15 @@ def main():
         print("  python quick_transcribe.py audio_files/meeting.wav")
         sys.exit(1)
     
+    # Construction is cheap; start loading models while the audio path is
+    # still being checked
+    try:
+        transcriber = MeetingTranscriber()
+    except Exception as e:
+        print(f"❌ Error during transcription: {str(e)}")
+        sys.exit(1)
+    threading.Thread(target=_preload_models, args=(transcriber,), daemon=True).start()
+    
     audio_path = sys.argv[1]
     if not os.path.exists(audio_path):
         print(f"❌ Error: File '{audio_path}' not found")
@@ -24,7 +41,6 @@ def main():
     print(f"🎙️  Starting transcription of: {audio_path}")
     
     try:
-        transcriber = MeetingTranscriber()
         result = transcriber.transcribe_with_speakers(audio_path)
         
         print(f"✅ Successfully transcribed {len(result)} segments")
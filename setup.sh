@@ -28,13 +28,14 @@ echo "📦 Creating requirements.txt..."
 cat > requirements.txt << EOF
 torch>=2.0.0
 torchaudio>=2.0.0
-openai-whisper>=20231117
+numpy>=1.24.0
+faster-whisper>=1.1.0
 pyannote.audio>=3.1.0
 librosa>=0.10.0
 soundfile>=0.12.0
 jupyter>=1.0.0
 matplotlib>=3.7.0
-pandas>=2.0.0
+orjson>=3.9.0
 huggingface_hub>=0.16.0
 pathlib
 logging
@@ -52,7 +53,7 @@ cat > README.md << 'EOF'
 A comprehensive tool for transcribing meeting recordings with automatic speaker identification.
 
 ## Features
-- High-quality transcription using OpenAI Whisper
+- High-quality transcription using Whisper (faster-whisper / CTranslate2)
 - Automatic speaker diarization (Speaker 1, Speaker 2, etc.)
 - Multiple output formats (text, JSON, CSV)
 - Batch processing support
@@ -64,6 +65,7 @@ A comprehensive tool for transcribing meeting recordings with automatic speaker
    ```bash
    pip install -r requirements.txt
    ```
+   Install `ffmpeg` as well (e.g. `brew install ffmpeg`) for fast MP3/M4A decoding.
 
 2. Get a Hugging Face token:
    - Visit: https://huggingface.co/pyannote/speaker-diarization-3.1
@@ -97,9 +99,17 @@ Usage: python quick_transcribe.py <audio_file_path>
 
 import sys
 import os
+import threading
 from pathlib import Path
 from meeting_transcriber import MeetingTranscriber
 
+def _preload_models(transcriber):
+    """Load models in the background; main() retries and reports on failure"""
+    try:
+        transcriber.ensure_models_loaded()
+    except Exception as e:
+        transcriber.logger.warning(f"Background model preload failed, retrying on first use: {e}")
+
 def main():
     if len(sys.argv) != 2:
         print("Usage: python quick_transcribe.py <audio_file_path>")
@@ -107,6 +117,15 @@ def main():
         print("  python quick_transcribe.py audio_files/meeting.wav")
         sys.exit(1)
     
+    # Construction is cheap; start loading models while the audio path is
+    # still being checked
+    try:
+        transcriber = MeetingTranscriber()
+    except Exception as e:
+        print(f"❌ Error during transcription: {str(e)}")
+        sys.exit(1)
+    threading.Thread(target=_preload_models, args=(transcriber,), daemon=True).start()
+    
     audio_path = sys.argv[1]
     if not os.path.exists(audio_path):
         print(f"❌ Error: File '{audio_path}' not found")
@@ -115,7 +134,6 @@ def main():
     print(f"🎙️  Starting transcription of: {audio_path}")
     
     try:
-        transcriber = MeetingTranscriber()
         result = transcriber.transcribe_with_speakers(audio_path)
         
         print(f"✅ Successfully transcribed {len(result)} segments")
@@ -149,5 +167,6 @@ echo "2. Get HuggingFace token from: https://huggingface.co/pyannote/speaker-dia
 echo "3. Edit config.py and replace YOUR_HUGGING_FACE_TOKEN with your actual token"
 echo "4. Place audio files in audio_files/ folder"
 echo "5. Run: python quick_transcribe.py audio_files/your_meeting.wav"
+echo "   (Optional: ./download_models.sh pre-fetches model weights, e.g. during an image build)"
 echo ""
 echo "🚀 You can also use the Jupyter notebook: transcription_notebook.ipynb"